@@ -0,0 +1,68 @@
+"""Measure the cost of accessing ``job.func`` on the app-bound job classes.
+
+RQ reads ``job.func`` several times while executing a job. The bound job
+classes cache the wrapper that pushes the app context, rather than building a
+new one on each access. This compares that to a plain RQ job, and to building
+the wrapper each time. Jobs are only created locally, so this doesn't need a
+Redis server.
+
+.. code-block:: text
+
+    $ python benchmarks/job_func.py
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing as t
+from functools import update_wrapper
+
+from flask import Flask
+from redis import Redis
+from rq import Queue
+from rq.job import Job
+
+from flask_rq._job_class import make_job_class
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+async def async_add(a: int, b: int) -> int:
+    return a + b
+
+
+def uncached_func(job: Job, app: Flask) -> t.Any:
+    """Build the wrapper the way it's done without any caching."""
+    func = t.cast(t.Callable[..., t.Any], Job.func.fget(job))  # type: ignore[attr-defined]
+
+    def new_func(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        with app.app_context():
+            return app.ensure_sync(func)(*args, **kwargs)
+
+    return update_wrapper(new_func, func)
+
+
+def main(number: int = 100_000) -> None:
+    app = Flask(__name__)
+    connection = Redis()
+    plain = Queue("plain", connection)
+    bound = Queue("bound", connection, job_class=make_job_class(app))
+
+    for func in (add, async_add):
+        plain_job = plain.create_job(func, (1, 2))
+        job = bound.create_job(func, (1, 2))
+        results = {
+            "rq.Job": timeit.timeit(lambda: plain_job.func, number=number),  # noqa: B023
+            "uncached": timeit.timeit(lambda: uncached_func(job, app), number=number),  # noqa: B023
+            "cached": timeit.timeit(lambda: job.func, number=number),  # noqa: B023
+        }
+        print(f"{func.__name__}:")
+
+        for name, total in results.items():
+            print(f"  {name:>8}: {total / number * 1e6:.3f} us per access")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,7 @@ def make_cli(app: Flask | Quart) -> None:
     """
     group = app.cli.group("rq")(rq_group)
     group.command("worker", with_appcontext=True)(worker_cmd)
+    group.command("worker-pool", with_appcontext=True)(worker_pool_cmd)
     app.cli.add_command(group)
 
 
@@ -79,6 +80,12 @@ def rq_group(ctx: click.Context) -> None:
         "queues",
     },
 )
+@click.option(
+    "--app-context",
+    type=click.Choice(["per-job", "per-worker"]),
+    help="Push an app context for each job, or reuse the worker's app context."
+    " Defaults to the RQ_WORKER_APP_CONTEXT config.",
+)
 @click.pass_obj
 def worker_cmd(
     obj: RQ,
@@ -92,9 +99,11 @@ def worker_cmd(
     max_idle_time: int | None,
     with_scheduler: bool,
     queues: list[str],
+    app_context: t.Literal["per-job", "per-worker"] | None,
 ) -> None:
     worker = obj.make_worker(
         queues,
+        app_context=app_context,
         name=name,
         default_result_ttl=results_ttl,
         worker_ttl=worker_ttl,
@@ -107,3 +116,66 @@ def worker_cmd(
         max_idle_time=max_idle_time,
         with_scheduler=with_scheduler,
     )
+
+
+@from_rq_cmd(
+    orig_cli.worker,  # type: ignore[attr-defined]
+    {
+        "burst",
+        "logging_level",
+        "results_ttl",
+        "worker_ttl",
+        "maintenance_interval",
+        "job_monitoring_interval",
+        "max_jobs",
+        "max_idle_time",
+        "with_scheduler",
+        "queues",
+    },
+)
+@click.option(
+    "--num-workers",
+    "-n",
+    type=int,
+    help="The number of worker processes. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--app-context",
+    type=click.Choice(["per-job", "per-worker"]),
+    help="Push an app context for each job, or reuse the worker's app context."
+    " Defaults to the RQ_WORKER_APP_CONTEXT config.",
+)
+@click.pass_obj
+def worker_pool_cmd(
+    obj: RQ,
+    burst: bool,
+    logging_level: str,
+    results_ttl: int,
+    worker_ttl: int,
+    maintenance_interval: int,
+    job_monitoring_interval: int,
+    max_jobs: int | None,
+    max_idle_time: int | None,
+    with_scheduler: bool,
+    queues: list[str],
+    num_workers: int | None,
+    app_context: t.Literal["per-job", "per-worker"] | None,
+) -> None:
+    """Start a pool of worker processes that share the loaded app. Workers
+    that exit unexpectedly are restarted.
+    """
+    pool = obj.make_worker_pool(
+        queues,
+        num_workers,
+        app_context=app_context,
+        default_result_ttl=results_ttl,
+        worker_ttl=worker_ttl,
+        maintenance_interval=maintenance_interval,
+        job_monitoring_interval=job_monitoring_interval,
+        work_kwargs={
+            "max_jobs": max_jobs,
+            "max_idle_time": max_idle_time,
+            "with_scheduler": with_scheduler,
+        },
+    )
+    pool.start(burst=burst, logging_level=logging_level or "INFO")
@@ -1,23 +1,31 @@
 from __future__ import annotations
 
+import collections.abc as cabc
+import os
 import typing as t
+from itertools import islice
 from weakref import WeakKeyDictionary
 
 import typing_extensions as te
 from flask import Flask
 from flask.globals import app_ctx as flask_app_ctx
-from rq import Queue
 from rq import Worker
+from rq.job import Job
+from rq.queue import EnqueueData
 
 from ._cli import make_cli
 from ._job_wrapper import JobWrapper
 from ._make import make_queues
+from ._queue import Queue
+from ._worker import WorkerPool
 
 if t.TYPE_CHECKING:
     from quart import Quart
 
 P = te.ParamSpec("P")
 R = t.TypeVar("R")
+TeardownCallable = t.Callable[[BaseException | None], t.Any]
+T_teardown = t.TypeVar("T_teardown", bound=TeardownCallable)
 
 
 class RQ:
@@ -32,6 +40,7 @@ class RQ:
         )
         self._flask_ctx: t.Any = None
         self._quart_ctx: t.Any = None
+        self._teardown_job_funcs: list[TeardownCallable] = []
 
         if app is not None:
             self.init_app(app)
@@ -55,6 +64,15 @@ class RQ:
 
             self._quart_ctx = app_ctx
 
+            @app.after_serving
+            async def close_async_connections() -> None:
+                for conn in {
+                    q.async_connection
+                    for q in self._queues[app].values()
+                    if q.async_connection is not None
+                }:
+                    await conn.aclose()
+
         self._queues[app] = make_queues(app)
         app.extensions["rq"] = self
         make_cli(app)
@@ -125,8 +143,44 @@ class RQ:
                 f"{e.args[0]}\nUse `rq.get_queue(name)` to use a specific queue."
             ) from None
 
+    def enqueue_many(
+        self,
+        job_datas: cabc.Iterable[EnqueueData],
+        queue: str = "default",
+        chunk_size: int = 1000,
+    ) -> list[Job]:
+        """Submit many jobs to a queue, writing them to Redis in batches
+        rather than making a round trip for each job.
+
+        Each item is created with :meth:`rq.Queue.prepare_data`. The items are
+        consumed in chunks, and each chunk is written using a single pipeline
+        with :meth:`rq.Queue.enqueue_many`.
+
+        .. code-block:: python
+
+            rq.enqueue_many(
+                Queue.prepare_data(send_email, (user_id,)) for user_id in user_ids
+            )
+
+        :param job_datas: The jobs to submit.
+        :param queue: The name of the queue to submit the jobs to.
+        :param chunk_size: The number of jobs to write in each pipeline.
+        """
+        q = self.get_queue(queue)
+        job_datas = iter(job_datas)
+        jobs: list[Job] = []
+
+        while chunk := list(islice(job_datas, chunk_size)):
+            jobs.extend(q.enqueue_many(chunk))
+
+        return jobs
+
     def make_worker(
-        self, queues: list[str] | tuple[str, ...] | None = None, **kwargs: t.Any
+        self,
+        queues: list[str] | tuple[str, ...] | None = None,
+        *,
+        app_context: t.Literal["per-job", "per-worker"] | None = None,
+        **kwargs: t.Any,
     ) -> Worker:
         """Create a worker for the current application that will watch the
         configured queues and execute jobs in the application context.
@@ -134,21 +188,113 @@ class RQ:
         :param queues: The named queues for the worker to watch, using the first
             queue's connection. By default, uses all the queues in order from
             :data:`RQ_QUEUES`.
+        :param app_context: How jobs use the application context. By default,
+            uses :data:`RQ_WORKER_APP_CONTEXT`.
         :param kwargs: Other arguments to pass to the worker constructor.
 
         .. versionchanged:: 1.0
             Uses order from ``RQ_QUEUES`` instead of forcing ``"default"`` first.
+
+        .. versionchanged:: 1.0
+            Added the ``app_context`` parameter.
         """
         app = self._get_current_app()
+        worker_queues = self._get_worker_queues(app, queues)
+
+        if app_context is None:
+            app_context = app.config.get("RQ_WORKER_APP_CONTEXT", "per-job")
+
+        job_class = worker_queues[0].job_class
+
+        if app_context == "per-worker":
+            job_class = type(
+                job_class.__name__, (job_class,), {"_reuse_app_context": True}
+            )
+        elif app_context != "per-job":
+            raise ValueError(
+                f"Unknown app context mode {app_context!r}, must be"
+                " 'per-job' or 'per-worker'."
+            )
+
+        return Worker(worker_queues, job_class=job_class, **kwargs)
+
+    def _get_worker_queues(
+        self, app: Flask | Quart, queues: list[str] | tuple[str, ...] | None
+    ) -> list[Queue]:
+        """Get the named queues for a worker to watch, or all the queues in
+        order if no names are given.
+
+        :param app: The app to get the queues for.
+        :param queues: The queue names to get.
+        """
         known_queues = self._queues[app]
-        worker_queues: list[Queue] = []
 
         if not queues:
-            worker_queues.extend(known_queues.values())
-        else:
-            worker_queues.extend(known_queues[k] for k in queues)
+            return list(known_queues.values())
+
+        return [known_queues[k] for k in queues]
+
+    def make_worker_pool(
+        self,
+        queues: list[str] | tuple[str, ...] | None = None,
+        num_workers: int | None = None,
+        *,
+        work_kwargs: dict[str, t.Any] | None = None,
+        **kwargs: t.Any,
+    ) -> WorkerPool:
+        """Create a pool of worker processes for the current application. Call
+        the pool's ``start`` method to fork the workers and manage them until
+        they are stopped. Workers that exit unexpectedly are restarted.
+
+        Each worker is forked from the current process, so the workers share
+        the already loaded application rather than each importing it again.
+        Each worker is created with :meth:`make_worker`.
+
+        :param queues: The named queues for the workers to watch. By default,
+            uses all the queues in order from :data:`RQ_QUEUES`.
+        :param num_workers: The number of worker processes. By default, uses
+            the number of CPUs.
+        :param work_kwargs: Arguments to pass to each worker's ``work`` method.
+            ``burst`` and ``logging_level`` are passed to the pool's ``start``
+            method instead.
+        :param kwargs: Other arguments to pass to :meth:`make_worker`.
+
+        .. versionadded:: 1.0
+        """
+        app = self._get_current_app()
+        # Check that the queue names are valid before starting any workers.
+        worker_queues = self._get_worker_queues(app, queues)
+
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+
+        return WorkerPool(
+            self,
+            worker_queues,
+            num_workers=num_workers,
+            worker_kwargs=kwargs,
+            work_kwargs=work_kwargs or {},
+        )
+
+    def teardown_job(self, f: T_teardown) -> T_teardown:
+        """Register a function to call after each job finishes, while the app
+        context is still active. It is passed the unhandled exception raised by
+        the job, or ``None``. It can be a sync or async function.
 
-        return Worker(worker_queues, job_class=worker_queues[0].job_class, **kwargs)
+        This is mostly useful with :data:`RQ_WORKER_APP_CONTEXT` set to
+        ``"per-worker"``, where the app context, and so its teardown functions,
+        are not pushed and popped around each job.
+
+        .. code-block:: python
+
+            @rq.teardown_job
+            def close_session(exc):
+                db.session.remove()
+
+        :param f: The function to register.
+        """
+        self._teardown_job_funcs.append(f)
+        return f
 
     @t.overload
     def job(self, f: t.Callable[P, R], *, queue: str = ...) -> JobWrapper[P, R]: ...
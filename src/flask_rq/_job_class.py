@@ -5,11 +5,59 @@ import weakref
 from functools import update_wrapper
 
 from flask import Flask
+from flask.globals import _cv_app as _flask_cv_app
 from rq.job import Job
 
 if t.TYPE_CHECKING:
     from quart import Quart
 
+    from ._extension import RQ
+
+
+def _get_cached(
+    cache: dict[t.Any, t.Any], func: t.Any, wrap: t.Callable[[t.Any], t.Any]
+) -> t.Any:
+    """Get the wrapped version of a function from a cache keyed by the
+    function, or wrap it and cache it if it's not present. Job functions are
+    importable, so they live for the whole process anyway. Bound methods are
+    created on each access and would keep their instance alive, so they're
+    wrapped each time rather than cached.
+
+    :param cache: The cache to look in.
+    :param func: The function to wrap.
+    :param wrap: Called to wrap the function if it's not cached.
+    """
+    if hasattr(func, "__self__"):
+        return wrap(func)
+
+    try:
+        return cache[func]
+    except KeyError:
+        cache[func] = out = wrap(func)
+        return out
+
+
+def _same_key(a: tuple[str | None, t.Any], b: tuple[str | None, t.Any]) -> bool:
+    """Check if a job's function name and instance are still the same as when
+    its wrapper was cached. The instance is compared by identity.
+    """
+    return a[0] == b[0] and a[1] is b[1]
+
+
+def _reuse_ctx(ctx: t.Any, app: Flask | Quart) -> bool:
+    """Check if the active app context belongs to the app and can be reused for
+    the next job. If so, reset its ``g`` namespace so data doesn't leak between
+    jobs.
+
+    :param ctx: The active app context, or ``None``.
+    :param app: The app the job is bound to.
+    """
+    if ctx is None or ctx.app is not app:
+        return False
+
+    ctx.g = app.app_ctx_globals_class()
+    return True
+
 
 class FlaskJob(Job):
     """An RQ job class that knows about the current Flask app and executes its
@@ -17,22 +65,52 @@ class FlaskJob(Job):
     """
 
     _flask_app: weakref.ref[Flask]
+    _sync_funcs: dict[t.Any, t.Any]
+    _app_func: tuple[tuple[str | None, t.Any], t.Any] | None = None
+    _reuse_app_context: bool = False
 
     @property
     def func(self) -> t.Any:
         """Wrap the job's function in a sync function that pushes a Flask
         application context. Async functions are also supported, relying on
         Flask's ``ensure_sync`` and asgiref.
+
+        The wrapper is created once and reused while the job's function name
+        and instance stay the same.
         """
+        key = (self.func_name, self.instance)
+
+        if self._app_func is not None and _same_key(self._app_func[0], key):
+            return self._app_func[1]
+
         func = t.cast(t.Callable[..., t.Any], super().func)
         app = self._flask_app()
         assert app is not None
+        sync_func = _get_cached(self._sync_funcs, func, app.ensure_sync)
+        reuse_ctx = self._reuse_app_context
+
+        def call(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            rq: RQ = app.extensions["rq"]
+            exc: BaseException | None = None
+
+            try:
+                return sync_func(*args, **kwargs)
+            except BaseException as e:
+                exc = e
+                raise
+            finally:
+                for f in reversed(rq._teardown_job_funcs):
+                    app.ensure_sync(f)(exc)
 
         def new_func(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            if reuse_ctx and _reuse_ctx(_flask_cv_app.get(None), app):
+                return call(*args, **kwargs)
+
             with app.app_context():
-                return app.ensure_sync(func)(*args, **kwargs)
+                return call(*args, **kwargs)
 
-        return update_wrapper(new_func, func)
+        self._app_func = (key, update_wrapper(new_func, func))
+        return new_func
 
 
 class QuartJob(Job):
@@ -41,36 +119,76 @@ class QuartJob(Job):
     """
 
     _quart_app: weakref.ref[Quart]
+    _async_funcs: dict[t.Any, t.Any]
+    _app_func: tuple[tuple[str | None, t.Any], t.Any] | None = None
+    _reuse_app_context: bool = False
 
     @property
     def func(self) -> t.Any:
         """Wrap the job's function in an async function that pushes a Quart
         application context. Sync functions are also supported, relying on
         Quart's ``ensure_async`` and asgiref.
+
+        The wrapper is created once and reused while the job's function name
+        and instance stay the same.
         """
+        key = (self.func_name, self.instance)
+
+        if self._app_func is not None and _same_key(self._app_func[0], key):
+            return self._app_func[1]
+
+        from quart.globals import _cv_app as _quart_cv_app
+
         func = t.cast(t.Callable[..., t.Any], super().func)
         app = self._quart_app()
         assert app is not None
+        async_func = _get_cached(self._async_funcs, func, app.ensure_async)
+        reuse_ctx = self._reuse_app_context
+
+        async def call(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            rq: RQ = app.extensions["rq"]
+            exc: BaseException | None = None
+
+            try:
+                return await async_func(*args, **kwargs)
+            except BaseException as e:
+                exc = e
+                raise
+            finally:
+                for f in reversed(rq._teardown_job_funcs):
+                    await app.ensure_async(f)(exc)
 
         async def new_func(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            if reuse_ctx and _reuse_ctx(_quart_cv_app.get(None), app):
+                return await call(*args, **kwargs)
+
             async with app.app_context():
-                return await app.ensure_async(func)(*args, **kwargs)
+                return await call(*args, **kwargs)
 
-        return update_wrapper(new_func, func)
+        self._app_func = (key, update_wrapper(new_func, func))
+        return new_func
 
 
 def make_job_class(app: Flask | Quart) -> type[Job]:
     """Create the appropriate job class for the given app. The app is stored on
     the new subclass so that it can push an app context and wrap sync/async
-    functions.
+    functions. Each class also has its own cache of wrapped functions.
 
     :param app: The app to create a bound job class for.
     """
     cls: type[Job]
 
     if isinstance(app, Flask):
-        cls = type("BoundFlaskJob", (FlaskJob,), {"_flask_app": weakref.ref(app)})
+        cls = type(
+            "BoundFlaskJob",
+            (FlaskJob,),
+            {"_flask_app": weakref.ref(app), "_sync_funcs": {}},
+        )
     else:
-        cls = type("BoundQuartJob", (QuartJob,), {"_quart_app": weakref.ref(app)})
+        cls = type(
+            "BoundQuartJob",
+            (QuartJob,),
+            {"_quart_app": weakref.ref(app), "_async_funcs": {}},
+        )
 
     return cls
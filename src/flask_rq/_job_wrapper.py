@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import collections.abc as cabc
 import typing as t
 from functools import update_wrapper
 
 import typing_extensions as te
+from rq import Queue
 from rq.job import Job
 
 if t.TYPE_CHECKING:
@@ -70,3 +72,49 @@ class JobWrapper(t.Generic[P, R]):
         """
         queue = self.rq.queues[self.queue]
         return queue.enqueue(self.func, *args, **kwargs)  # pyright: ignore
+
+    def enqueue_many(
+        self,
+        args_list: cabc.Iterable[tuple[t.Any, ...]],
+        chunk_size: int = 1000,
+        **kwargs: t.Any,
+    ) -> list[Job]:
+        """Submit many calls of the wrapped function to the queue, writing
+        them to Redis in batches rather than making a round trip for each job.
+
+        .. code-block:: python
+
+            send_email.enqueue_many((user_id,) for user_id in user_ids)
+
+        Use :meth:`.RQ.enqueue_many` if each job needs different keyword
+        arguments or options.
+
+        :param args_list: The positional arguments for each job.
+        :param chunk_size: The number of jobs to write in each pipeline.
+        :param kwargs: Any keyword arguments that can be passed to
+            :meth:`rq.Queue.prepare_data`, applied to every job.
+        """
+        return self.rq.enqueue_many(
+            (Queue.prepare_data(self.func, args, **kwargs) for args in args_list),
+            queue=self.queue,
+            chunk_size=chunk_size,
+        )
+
+    async def enqueue_async(self, *args: P.args, **kwargs: P.kwargs) -> Job:
+        """Submit the wrapped function to the queue for background execution,
+        without blocking the event loop.
+
+        This retains the same static type signature for as the wrapped function,
+        except it returns an awaitable :class:`rq.Job` instance.
+
+        For Quart apps, the job is sent using an async Redis connection. For
+        Flask apps, or if RQ needs to read from Redis while enqueuing, such as
+        when using ``depends_on``, :meth:`enqueue` is called in a thread.
+
+        :param args: Any positional arguments accepted by the wrapped function.
+        :param kwargs: Any keyword arguments accepted by the wrapped function,
+            along with any keyword arguments that can be passed to
+            :meth:`rq.Queue.enqueue`.
+        """
+        queue = self.rq.queues[self.queue]
+        return await queue.enqueue_async(self.func, *args, **kwargs)
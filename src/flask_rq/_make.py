@@ -4,13 +4,14 @@ import typing as t
 from pkgutil import resolve_name
 
 from flask import Flask
-from rq import Queue
 
 from flask_rq._job_class import make_job_class
+from flask_rq._queue import Queue
 
 if t.TYPE_CHECKING:
     from quart import Quart
     from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
 
 
 def make_queues(app: Flask | Quart) -> dict[str, Queue]:
@@ -26,10 +27,25 @@ def make_queues(app: Flask | Quart) -> dict[str, Queue]:
     else:
         conn_cls = conn_cls_conf
 
+    # Async connections are only created for Quart, where they are used from
+    # the app's single event loop.
+    async_conn_cls: type[AsyncRedis] | None = None
+
+    if not isinstance(app, Flask):
+        async_conn_cls_conf: str | type[AsyncRedis] = config.get(
+            "async_connection_class", "redis.asyncio.Redis"
+        )
+
+        if isinstance(async_conn_cls_conf, str):
+            async_conn_cls = resolve_name(async_conn_cls_conf)
+        else:
+            async_conn_cls = async_conn_cls_conf
+
     if (is_async := config.get("async", None)) is None:
         is_async = not app.testing
 
     connections: dict[str, Redis] = {}
+    async_connections: dict[str, AsyncRedis] = {}
     conn_refs: dict[str, str] = {}
 
     # Collect connections by name first. This allows using forward references to
@@ -46,10 +62,15 @@ def make_queues(app: Flask | Quart) -> dict[str, Queue]:
             else:
                 # This is a connection URL.
                 connections[name] = conn_cls.from_url(conn_conf)  # pyright: ignore
+
+                if async_conn_cls is not None:
+                    async_connections[name] = async_conn_cls.from_url(conn_conf)
         else:
             connections[name] = conn_cls(**conn_conf)
 
-    default_conn = connections["default"]
+            if async_conn_cls is not None:
+                async_connections[name] = async_conn_cls(**conn_conf)
+
     job_class = make_job_class(app)
     queues: dict[str, Queue] = {}
 
@@ -57,18 +78,22 @@ def make_queues(app: Flask | Quart) -> dict[str, Queue]:
     # connection it references.
     for name in config.get("queues", ["default"]):
         if name in connections:
-            conn = connections[name]
+            conn_name = name
         elif name in conn_refs:
-            if (conn_name := conn_refs[name]) in connections:
-                conn = connections[conn_name]
-            else:
+            if (conn_name := conn_refs[name]) not in connections:
                 raise RuntimeError(
                     f'\'RQ_QUEUE_CONNECTIONS["{conn_name}"] must be defined'
                     f' for RQ_QUEUE_CONNECTIONS["{name}"] to reference it.\''
                 )
         else:
-            conn = default_conn
+            conn_name = "default"
 
-        queues[name] = Queue(name, conn, is_async=is_async, job_class=job_class)
+        queues[name] = Queue(
+            name,
+            connections[conn_name],
+            is_async=is_async,
+            job_class=job_class,
+            async_connection=async_connections.get(conn_name),
+        )
 
     return queues
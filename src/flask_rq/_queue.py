@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+from rq import Queue as BaseQueue
+from rq.job import Job
+
+if t.TYPE_CHECKING:
+    from redis.asyncio import Redis as AsyncRedis
+
+
+class Queue(BaseQueue):
+    """An RQ queue that can also have an async Redis connection, which is used
+    to enqueue jobs without blocking the event loop.
+
+    This class itself is not part of the public API, only its documented
+    methods are.
+
+    :param args: Arguments passed to :class:`rq.Queue`.
+    :param async_connection: The async Redis connection to use for
+        :meth:`enqueue_async`.
+    :param kwargs: Arguments passed to :class:`rq.Queue`.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        async_connection: AsyncRedis | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.async_connection: AsyncRedis | None = async_connection
+        """The async Redis connection used by :meth:`enqueue_async`.
+
+        :meta private:
+        """
+
+    async def enqueue_async(self, f: t.Any, *args: t.Any, **kwargs: t.Any) -> Job:
+        """Create a job and enqueue it without blocking the event loop. Takes
+        the same arguments as :meth:`rq.Queue.enqueue`.
+
+        The job is created locally, and RQ's Redis commands to enqueue it are
+        recorded in a pipeline, which is then sent using the async connection.
+        If the queue has no async connection, the job has dependencies, or
+        ``unique`` is used, RQ needs to read from Redis while enqueuing, so
+        :meth:`rq.Queue.enqueue` is called in a thread instead. It's also called
+        in a thread if :attr:`~rq.Queue.is_async` is disabled, since the job is
+        executed immediately.
+
+        :param f: The job function.
+        :param args: Positional arguments to pass to the function.
+        :param kwargs: Keyword arguments to pass to the function, along with
+            any keyword arguments that can be passed to
+            :meth:`rq.Queue.enqueue`.
+        """
+        if (
+            self.async_connection is None
+            or not self.is_async
+            or kwargs.get("depends_on")
+            or kwargs.get("unique")
+        ):
+            return await asyncio.to_thread(self.enqueue, f, *args, **kwargs)
+
+        if not self.redis_server_version:
+            # RQ records the server version on each job. It's only looked up
+            # once, use a thread rather than duplicating RQ's logic.
+            await asyncio.to_thread(self.get_redis_server_version)
+
+        # Commands are only buffered by the sync pipeline, which is never
+        # executed. They are sent by the async pipeline instead.
+        with self.connection.pipeline() as pipe:
+            job = self.enqueue(f, *args, pipeline=pipe, **kwargs)
+
+            async with self.async_connection.pipeline() as async_pipe:
+                for command_args, options in pipe.command_stack:
+                    async_pipe.execute_command(*command_args, **options)
+
+                await async_pipe.execute()
+
+        return job
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import collections.abc as cabc
+import multiprocessing
+import typing as t
+
+from rq import Queue as BaseQueue
+from rq.worker_pool import WorkerPool as BaseWorkerPool
+
+if t.TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from ._extension import RQ
+
+
+class WorkerPool(BaseWorkerPool):
+    """An RQ worker pool that forks each worker from the current process. The
+    workers share the already loaded application and its active app context,
+    rather than each importing the app again. Each worker is created with
+    :meth:`.RQ.make_worker`, so it uses the app's queues, connections, and job
+    class. Workers that exit unexpectedly are restarted, unless running in
+    burst mode.
+
+    This class itself is not part of the public API, only the methods it
+    inherits from :class:`rq.worker_pool.WorkerPool` are.
+
+    :param rq: The RQ extension instance, used to create each worker.
+    :param queues: The queues for the workers to watch.
+    :param num_workers: The number of worker processes to run.
+    :param worker_kwargs: Arguments to pass to :meth:`.RQ.make_worker`.
+    :param work_kwargs: Arguments to pass to each worker's ``work`` method.
+    """
+
+    def __init__(
+        self,
+        rq: RQ,
+        queues: cabc.Sequence[BaseQueue],
+        num_workers: int,
+        worker_kwargs: dict[str, t.Any],
+        work_kwargs: dict[str, t.Any],
+    ) -> None:
+        super().__init__(
+            queues,
+            connection=queues[0].connection,
+            num_workers=num_workers,
+            job_class=queues[0].job_class,
+        )
+        self._rq = rq
+        self._worker_kwargs = worker_kwargs
+        self._work_kwargs = work_kwargs
+
+    def get_worker_process(
+        self,
+        name: str,
+        burst: bool,
+        _sleep: float = 0,
+        logging_level: str = "INFO",
+    ) -> BaseProcess:
+        # Always fork, even where it isn't the default start method, so that the
+        # worker inherits the loaded app.
+        return multiprocessing.get_context("fork").Process(
+            target=self._run_worker,
+            args=(name, burst, logging_level),
+            name=f"Worker {name} (WorkerPool {self.name})",
+        )
+
+    def _run_worker(self, name: str, burst: bool, logging_level: str) -> None:
+        """Create and run a worker. Called in the forked worker process."""
+        worker = self._rq.make_worker(
+            self._queue_names, name=name, **self._worker_kwargs
+        )
+        worker.work(burst=burst, logging_level=logging_level, **self._work_kwargs)
@@ -61,3 +61,25 @@ def test_worker(worker_cls: Mock, app: Flask) -> None:
     work: Mock = worker.work
     work.assert_called()
     assert "burst" in work.call_args.kwargs
+
+
+@pytest.mark.usefixtures("rq")
+@patch("flask_rq._extension.Worker", spec=True)
+def test_worker_app_context(worker_cls: Mock, app: Flask) -> None:
+    runner = app.test_cli_runner()
+    runner.invoke(args=["rq", "worker", "--app-context", "per-worker"])
+    job_class = worker_cls.call_args.kwargs["job_class"]
+    assert job_class._reuse_app_context
+
+
+@pytest.mark.usefixtures("rq")
+@patch("flask_rq._extension.WorkerPool", spec=True)
+def test_worker_pool(pool_cls: Mock, app: Flask) -> None:
+    runner = app.test_cli_runner()
+    runner.invoke(args=["rq", "worker-pool", "-n", "3", "--burst", "low"])
+    pool_cls.assert_called()
+    assert pool_cls.call_args.kwargs["num_workers"] == 3
+    assert "default_result_ttl" in pool_cls.call_args.kwargs["worker_kwargs"]
+    assert "max_jobs" in pool_cls.call_args.kwargs["work_kwargs"]
+    start: Mock = pool_cls.return_value.start
+    start.assert_called_with(burst=True, logging_level="INFO")
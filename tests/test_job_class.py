@@ -5,8 +5,11 @@ import typing as t
 import pytest
 from flask import current_app as flask_current_app
 from flask import Flask
+from flask import g
+from flask.globals import _cv_app as flask_cv_app
 from quart import current_app as quart_current_app
 from quart import Quart
+from quart.globals import _cv_app as quart_cv_app
 
 from flask_rq import RQ
 
@@ -49,3 +52,88 @@ async def test_quart(quart_app: Quart, rq: RQ, func: t.Callable[[], str]) -> Non
     job_func = job.func
     assert job_func is not None
     assert await job_func() == "found"
+
+
+@pytest.mark.parametrize("func", [flask_sync_job, flask_async_job])
+def test_flask_func_cached(app: Flask, rq: RQ, func: t.Callable[[], str]) -> None:
+    """The wrapper is reused for a job, and the sync wrapper is reused across
+    jobs with the same function.
+    """
+    with app.app_context():
+        job = rq.queue.create_job(func)
+        other = rq.queue.create_job(func)
+
+    assert job.func is job.func
+    assert job.func is not other.func
+    assert len(type(job)._sync_funcs) == 1  # type: ignore[attr-defined]
+    assert other.perform() == "found"
+
+
+async def test_quart_func_cached(quart_app: Quart, rq: RQ) -> None:
+    async with quart_app.app_context():
+        job = rq.queue.create_job(quart_sync_job)
+
+    assert job.func is job.func
+    assert len(type(job)._async_funcs) == 1  # type: ignore[attr-defined]
+
+
+def flask_g_job() -> tuple[bool, int]:  # pragma: no cover
+    had_value = "value" in g
+    g.value = 1
+    return had_value, id(flask_cv_app.get())
+
+
+def test_flask_per_worker(app: Flask, rq: RQ) -> None:
+    """The active app context is reused, with g reset between jobs."""
+    with app.app_context() as ctx:
+        job_class = rq.make_worker(app_context="per-worker").job_class
+        job = job_class.create(flask_g_job, connection=rq.queue.connection)
+        assert job.perform() == (False, id(ctx))
+        job = job_class.create(flask_g_job, connection=rq.queue.connection)
+        assert job.perform() == (False, id(ctx))
+
+
+def test_flask_per_job(app: Flask, rq: RQ) -> None:
+    """A new app context is pushed for each job."""
+    with app.app_context() as ctx:
+        job = rq.queue.create_job(flask_g_job)
+        assert job.perform()[1] != id(ctx)
+
+
+async def test_quart_per_worker(quart_app: Quart, rq: RQ) -> None:
+    async with quart_app.app_context() as ctx:
+        job_class = rq.make_worker(app_context="per-worker").job_class
+        job = job_class.create(
+            quart_current_app_ctx_job, connection=rq.queue.connection
+        )
+
+        job_func = job.func
+        assert job_func is not None
+        assert await job_func() == id(ctx)
+
+
+async def quart_current_app_ctx_job() -> int:  # pragma: no cover
+    return id(quart_cv_app.get())
+
+
+def flask_fail_job() -> None:  # pragma: no cover
+    raise ValueError("fail")
+
+
+def test_teardown_job(app: Flask, rq: RQ) -> None:
+    """Teardown functions are called with the job's exception."""
+    calls: list[BaseException | None] = []
+
+    @rq.teardown_job
+    def record(exc: BaseException | None) -> None:
+        assert flask_current_app.config["FIND"] == "found"
+        calls.append(exc)
+
+    with app.app_context():
+        rq.queue.create_job(flask_sync_job).perform()
+
+        with pytest.raises(ValueError):
+            rq.queue.create_job(flask_fail_job).perform()
+
+    assert calls[0] is None
+    assert isinstance(calls[1], ValueError)
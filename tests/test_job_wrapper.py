@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 
 import pytest
+from flask import Flask
+from quart import Quart
+from rq.job import Job
 
 from flask_rq import RQ
 
@@ -68,3 +72,55 @@ def test_job_low(rq: RQ) -> None:
     r = j.latest_result()
     assert r is not None
     assert r.return_value == 32
+
+
+@pytest.mark.usefixtures("app_ctx")
+def test_enqueue_many(rq: RQ) -> None:
+    job_mul = rq.job(queue="low")(mul)
+    jobs = job_mul.enqueue_many([(1, 2), (3, 4), (5, 6)], chunk_size=2)
+    assert [j.origin for j in jobs] == ["low"] * 3
+    assert [j.return_value() for j in jobs] == [2, 12, 30]
+
+
+def test_enqueue_many_async(app: Flask) -> None:
+    app.config["RQ_ASYNC"] = True
+    rq = RQ(app)
+    job_mul = rq.job(mul)
+
+    with app.app_context():
+        jobs = job_mul.enqueue_many(((i, i) for i in range(5)), chunk_size=2)
+        assert rq.queue.count == 5
+        assert rq.queue.job_ids == [j.id for j in jobs]
+
+
+async def test_enqueue_async(quart_app: Quart) -> None:
+    """The job is sent with the async connection, and a worker executes it.
+    The async connections are closed when the app stops serving.
+    """
+    quart_app.config["RQ_ASYNC"] = True
+    rq = RQ(quart_app)
+    job_mul = rq.job(queue="high")(mul)
+
+    async with quart_app.test_app(), quart_app.app_context():
+        queue = rq.queues["high"]
+        assert queue.async_connection is not None
+        j = await job_mul.enqueue_async(4, 8)
+        assert queue.job_ids == [j.id]
+        assert Job.fetch(j.id, connection=queue.connection).args == (4, 8)
+        worker = rq.make_worker(["high"])
+
+    worker.work(burst=True)
+    assert j.return_value() == 32
+
+
+def test_enqueue_async_flask(app: Flask, rq: RQ) -> None:
+    """Flask queues don't have an async connection, so enqueue is called in a
+    thread instead.
+    """
+    job_mul = rq.job(mul)
+
+    with app.app_context():
+        assert rq.queue.async_connection is None
+        j = asyncio.run(job_mul.enqueue_async(6, 7))
+
+    assert j.return_value() == 42
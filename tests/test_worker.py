@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import signal
 import typing as t
 
 import pytest
@@ -84,3 +86,51 @@ def test_worker_no_default(rq: RQ) -> None:
     worker = rq.make_worker(["low", "high"])
     assert len(worker.queues) == 2
     assert worker.connection is rq.queues["low"].connection
+
+
+@pytest.mark.usefixtures("app_ctx")
+def test_worker_app_context(app: Flask, rq: RQ) -> None:
+    assert not rq.make_worker().job_class._reuse_app_context  # type: ignore[attr-defined]
+    worker = rq.make_worker(app_context="per-worker")
+    assert worker.job_class._reuse_app_context  # type: ignore[attr-defined]
+    assert issubclass(worker.job_class, rq.queue.job_class)
+    app.config["RQ_WORKER_APP_CONTEXT"] = "per-worker"
+    assert rq.make_worker().job_class._reuse_app_context  # type: ignore[attr-defined]
+
+
+@pytest.mark.usefixtures("app_ctx")
+def test_worker_bad_app_context(rq: RQ) -> None:
+    with pytest.raises(ValueError, match="Unknown app context mode"):
+        rq.make_worker(app_context="nothing")  # type: ignore[arg-type]
+
+
+def flask_pid_job() -> tuple[int, str]:  # pragma: no cover
+    return os.getpid(), flask_current_app.config["FIND"]
+
+
+def test_worker_pool(app: Flask, rq: RQ) -> None:
+    """Workers are forked from the current process and run jobs in the app
+    context.
+    """
+    sigint = signal.getsignal(signal.SIGINT)
+    sigterm = signal.getsignal(signal.SIGTERM)
+
+    with app.app_context():
+        jobs = [rq.queue.enqueue(flask_pid_job) for _ in range(4)]
+        pool = rq.make_worker_pool(["default"], 2)
+
+        try:
+            pool.start(burst=True)
+        finally:
+            signal.signal(signal.SIGINT, sigint)
+            signal.signal(signal.SIGTERM, sigterm)
+
+    results = [j.return_value() for j in jobs]
+    assert all(r is not None and r[1] == "found" for r in results)
+    assert os.getpid() not in {r[0] for r in results if r is not None}
+
+
+@pytest.mark.usefixtures("app_ctx")
+def test_worker_pool_bad_queue(rq: RQ) -> None:
+    with pytest.raises(KeyError):
+        rq.make_worker_pool(["nothing"])